@@ -1,8 +1,5 @@
 import requests
 import json
-import hashlib
-import hmac
-import base64
 from datetime import datetime
 
 class KisAPI:
@@ -29,6 +26,9 @@ class KisAPI:
         
         self.access_token = None
         
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 세션을 재사용
+        self.session = requests.Session()
+        
     def get_access_token(self, retry_count=3):
         """액세스 토큰 발급"""
         url = f"{self.base_url}/oauth2/tokenP"
@@ -46,7 +46,7 @@ class KisAPI:
         for attempt in range(retry_count):
             try:
                 print(f"토큰 발급 시도 {attempt + 1}/{retry_count}...")
-                response = requests.post(url, headers=headers, data=json.dumps(body), timeout=10)
+                response = self.session.post(url, headers=headers, data=json.dumps(body), timeout=10)
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -101,7 +101,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+            response = self.session.post(url, headers=headers, data=json.dumps(data))
             response.raise_for_status()
             
             result = response.json()
@@ -142,7 +142,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             
             result = response.json()
@@ -174,7 +174,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             
             result = response.json()
@@ -213,7 +213,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(order_data))
+            response = self.session.post(url, headers=headers, data=json.dumps(order_data))
             response.raise_for_status()
             
             result = response.json()
@@ -252,7 +252,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(order_data))
+            response = self.session.post(url, headers=headers, data=json.dumps(order_data))
             response.raise_for_status()
             
             result = response.json()
@@ -288,7 +288,7 @@ class KisAPI:
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             
             result = response.json()